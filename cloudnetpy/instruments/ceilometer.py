@@ -34,7 +34,7 @@ class Ceilometer:
         cloud_ind, cloud_values, cloud_limit = _estimate_clouds_from_beta(beta)
         beta_smooth[cloud_ind] = cloud_limit
         sigma = _calc_sigma_units(self.time, self.range)
-        beta_smooth = scipy.ndimage.filters.gaussian_filter(beta_smooth, sigma)
+        beta_smooth = scipy.ndimage.gaussian_filter(beta_smooth, sigma)
         beta_smooth[cloud_ind] = cloud_values
         beta_smooth = _screen_beta(beta_smooth, True)
         return self.backscatter, beta, beta_smooth
@@ -48,14 +48,17 @@ class Ceilometer:
             smooth (bool, optional): Should be true if input beta is smoothed.
                 Default is False.
 
+        Returns:
+            MaskedArray: Screened backscatter. Shares data with the input.
+
         """
-        beta = ma.copy(beta_uncorrected)
         n_gates, _, saturation_noise, noise_min = self.noise_params
         noise_min = noise_min[0] if smooth else noise_min[1]
-        noise = _estimate_noise_from_top_gates(beta, n_gates, noise_min)
-        beta = _reset_low_values_above_saturation(beta, is_saturation, saturation_noise)
-        beta = _remove_noise(beta, noise)
-        return beta
+        noise = _estimate_noise_from_top_gates(beta_uncorrected, n_gates, noise_min)
+        is_noise = (_find_low_values_above_saturation(beta_uncorrected, is_saturation,
+                                                      saturation_noise)
+                    | _find_low_snr(beta_uncorrected, noise))
+        return ma.masked_where(is_noise, beta_uncorrected, copy=False)
 
     def _find_saturated_profiles(self):
         """Estimates saturated profiles using the variance of the top range gates."""
@@ -64,12 +67,10 @@ class Ceilometer:
         return var < var_lim
 
 
-def _remove_noise(beta_in, noise):
-    beta = ma.copy(beta_in)
+def _find_low_snr(beta, noise):
+    """Finds values with too low signal-to-noise ratio."""
     snr_limit = 5
-    snr = (beta.T / noise)
-    beta[snr.T < snr_limit] = ma.masked
-    return beta
+    return ma.filled((beta.T < snr_limit * noise).T, False)
 
 
 def _calc_sigma_units(time, range_instru):
@@ -111,15 +112,16 @@ def _estimate_noise_from_top_gates(beta, n_gates, noise_min):
     return noise
 
 
-def _reset_low_values_above_saturation(beta_in, is_saturation, saturation_noise):
-    """Removes low values in saturated profiles above peak."""
-    beta = ma.copy(beta_in)
-    for saturated_profile in np.where(is_saturation)[0]:
-        profile = beta[saturated_profile, :]
-        peak_ind = np.argmax(profile)
-        alt_ind = np.where(profile[peak_ind:] < saturation_noise)[0] + peak_ind
-        beta[saturated_profile, alt_ind] = ma.masked
-    return beta
+def _find_low_values_above_saturation(beta, is_saturation, saturation_noise):
+    """Finds low values in saturated profiles above peak."""
+    saturated_profiles = np.where(is_saturation)[0]
+    saturated_beta = beta[saturated_profiles, :]
+    peak_ind = ma.argmax(saturated_beta, axis=1)
+    is_above_peak = np.arange(beta.shape[1]) >= peak_ind[:, np.newaxis]
+    is_low = ma.filled(saturated_beta < saturation_noise, False)
+    is_noise = np.zeros(beta.shape, dtype=bool)
+    is_noise[saturated_profiles, :] = is_above_peak & is_low
+    return is_noise
 
 
 def _calc_range_uncorrected_beta(beta, range_squared):
@@ -137,17 +139,19 @@ def _calc_range_uncorrected_beta(beta, range_squared):
 
 
 def _calc_range_corrected_beta(beta, range_squared):
-    """Calculates range corrected beta.
+    """Calculates range corrected beta in place.
 
     Args:
-        beta (ndarray): 2D attenuated backscatter.
+        beta (ndarray): 2D attenuated backscatter. Masked values are not
+            modified.
         range_squared (ndarray): 1D altitude vector (km), squared.
 
     Returns:
         ndarray: 2D range corrected beta.
 
     """
-    return beta * range_squared
+    beta *= range_squared
+    return beta
 
 
 def _get_range_squared(range_instru):
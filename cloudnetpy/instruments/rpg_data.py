@@ -1,7 +1,16 @@
 """Module aiming to implement a generic RPG data reader."""
+from functools import lru_cache
 import numpy as np
 from cloudnetpy.instruments.rpg_header import read_rpg_header, get_rpg_file_type
 
+PROFILE_HEADER = np.dtype([('sample_length', '<i4'),
+                           ('time', '<u4'),
+                           ('time_ms', '<i4'),
+                           ('quality_flag', 'i1')])
+
+COMPRESSED_HEADER = np.dtype([('dummy', '<i4'),
+                              ('n_blocks', 'i1')])
+
 
 class RpgBin:
     """RPG Cloud Radar Level 0/1 Version 2/3 data reader."""
@@ -15,11 +24,11 @@ class RpgBin:
         """Reads the actual data from rpg binary file."""
 
         def _init_float_blocks():
-            block_one = np.zeros((n_profiles, n_floats), dtype=np.int32)
+            block_one = np.zeros((n_profiles, n_floats), dtype=np.float32)
             if self.level == 1:
                 block_two = np.zeros((n_profiles,
                                       self.header['n_range_levels'],
-                                      len(dict2)))
+                                      len(dict2)), dtype=np.float32)
             else:
                 for key in dict2:
                     dict2[key] = np.zeros((n_profiles,
@@ -34,28 +43,11 @@ class RpgBin:
         def _pre_calc_range():
             """Need this later in the loop."""
             if self.level == 0 and self.header['compression'] > 0:
-                return [max_spectra * n for n in range(n_keys)]
+                return np.arange(n_keys)[:, np.newaxis] * max_spectra
             return None
 
-        file = open(self.filename, 'rb')
-        file.seek(self._file_position)
-        n_profiles = int(np.fromfile(file, np.int32, 1))
-        max_spectra = max(self.header['n_spectral_samples'])
-        dict0 = _create_dict0(n_profiles)
-        dict1 = _create_dict1()
-        dict2 = _create_dict2(self.level, self.header)
-        n_keys = len(dict2)
-        ran = _pre_calc_range()
-        n_floats = _get_float_block_length(self.level, self.header, dict1)
-        float_block1, float_block2 = _init_float_blocks()
-        n_samples_at_each_height = _get_n_samples(self.header)
-
-        for prof in range(n_profiles):
-
-            dict0['sample_length'][prof] = np.fromfile(file, np.int32, 1)
-            dict0['time'][prof] = np.fromfile(file, np.uint32, 1)
-            dict0['time_ms'][prof] = np.fromfile(file, np.int32, 1)
-            dict0['quality_flag'][prof] = np.fromfile(file, np.int8, 1)
+        def _read_profile(prof):
+            profile_header[prof] = np.fromfile(file, PROFILE_HEADER, 1)
             float_block1[prof, :] = np.fromfile(file, np.float32, n_floats)
             is_data_ind = np.where(np.fromfile(file, np.int8,
                                                self.header['n_range_levels']))[0]
@@ -68,32 +60,55 @@ class RpgBin:
 
             elif self.header['compression'] == 0:
 
-                n_samples = n_samples_at_each_height[is_data_ind]
-                dtype = ' '.join([f"int32, ({n_keys*x},)float32, " for x in n_samples])
-                data_chunk = np.array(np.fromfile(file, np.dtype(dtype), 1)[0].tolist())[1::2]
-                for alt_ind, array in zip(is_data_ind, data_chunk):
-                    float_block2[prof, alt_ind, :n_samples_at_each_height[alt_ind]*n_keys] = array
+                n_samples = tuple(n_samples_at_each_height[is_data_ind].tolist())
+                dtype = _get_uncompressed_dtype(n_samples, n_keys)
+                data_chunk = np.fromfile(file, dtype, 1)[0]
+                for ind, alt_ind in enumerate(is_data_ind):
+                    float_block2[prof, alt_ind, :n_samples[ind]*n_keys] = data_chunk[f"values{ind}"]
 
             else:
 
                 for alt_ind in is_data_ind:
 
-                    _ = np.fromfile(file, np.int32, 1)
-                    n_blocks = np.fromfile(file, np.int8, 1)[0]
+                    n_blocks = np.fromfile(file, COMPRESSED_HEADER, 1)['n_blocks'][0]
                     min_ind, max_ind = np.fromfile(file, np.dtype(f"({n_blocks}, )int16"), 2)
-                    n_indices = max_ind - min_ind
-                    n_values = (sum(n_indices) + len(n_indices)) * n_keys
                     inds = np.concatenate([np.arange(i1, i2+1) for i1, i2 in zip(min_ind, max_ind)])
-                    inds = np.concatenate([inds+n for n in ran])
-                    float_block2[prof, alt_ind, inds] = np.fromfile(file, np.float32, n_values)
-                    _ = np.fromfile(file, np.int32, 2)
+                    inds = (inds + ran).ravel()
+                    dtype = _get_compressed_dtype(len(inds), self.header['anti_alias'])
+                    # anti-aliasing fields need to be saved somehow also
+                    float_block2[prof, alt_ind, inds] = np.fromfile(file, dtype, 1)['values'][0]
 
-                    if self.header['anti_alias'] == 1:
-                        # these need to be saved somehow also
-                        is_anti_al, min_vel = np.fromfile(file, np.dtype('int8, float32'), 1)[0]
+        file = open(self.filename, 'rb')
+        file.seek(self._file_position)
+        n_profiles = int(np.fromfile(file, np.int32, 1)[0])
+        max_spectra = max(self.header['n_spectral_samples'])
+        profile_header = np.zeros(n_profiles, PROFILE_HEADER)
+        dict1 = _create_dict1()
+        dict2 = _create_dict2(self.level, self.header)
+        n_keys = len(dict2)
+        ran = _pre_calc_range()
+        n_floats = _get_float_block_length(self.level, self.header, dict1)
+        float_block1, float_block2 = _init_float_blocks()
+        n_samples_at_each_height = _get_n_samples(self.header)
+
+        profiles = None
+        if self.level == 1:
+            profiles = _read_uniform_profiles(file, n_profiles, n_floats,
+                                              self.header['n_range_levels'], n_keys)
+
+        if profiles is None:
+            for prof in range(n_profiles):
+                _read_profile(prof)
+        else:
+            is_data_ind = np.where(profiles['is_data'][0])[0]
+            profile_header[:] = profiles['header']
+            float_block1[:] = profiles['float_block1']
+            float_block2[:, is_data_ind, :] = profiles['values'].reshape(
+                n_profiles, len(is_data_ind), n_keys)
 
         file.close()
 
+        dict0 = _create_dict0(profile_header)
         for n, name in enumerate(dict1):
             dict1[name] = float_block1[:, n]
 
@@ -112,19 +127,93 @@ class RpgBin:
         return {**dict0, **dict1, **dict2}
 
 
+def _read_uniform_profiles(file, n_profiles, n_floats, n_range_levels, n_keys):
+    """Reads all Level 1 profiles with one read, if they share the same data mask.
+
+    Returns:
+        ndarray: Structured array of profiles or None if the profiles are not
+            uniform. In the latter case, file position is not changed.
+
+    """
+    position = file.tell()
+    n_valid = _get_uniform_n_valid(file, n_profiles, n_floats, n_range_levels, n_keys)
+    file.seek(position)
+    if n_valid is None:
+        return None
+    dtype = _profile_dtype(n_floats, n_range_levels, n_keys * n_valid)
+    profiles = np.fromfile(file, dtype, n_profiles)
+    if len(profiles) == n_profiles:
+        return profiles
+    file.seek(position)
+    return None
+
+
+def _get_uniform_n_valid(file, n_profiles, n_floats, n_range_levels, n_keys):
+    """Returns number of valid range gates if all profiles share the same data mask.
+
+    Only the data masks are read. Profile headers and values are skipped
+    over, and the search stops at the first profile with a different mask.
+
+    Returns:
+        int: Number of valid range gates or None if the profiles are not uniform.
+
+    """
+    first_mask = None
+    for _ in range(n_profiles):
+        file.seek(PROFILE_HEADER.itemsize + 4*n_floats, 1)
+        is_data = np.fromfile(file, np.int8, n_range_levels)
+        if first_mask is None:
+            first_mask = is_data
+        if len(is_data) < n_range_levels or not np.array_equal(is_data, first_mask):
+            return None
+        file.seek(4 * n_keys * np.count_nonzero(is_data), 1)
+    if first_mask is None:
+        return None
+    return np.count_nonzero(first_mask)
+
+
+def _profile_dtype(n_floats, n_range_levels, n_values=0):
+    return np.dtype([('header', PROFILE_HEADER),
+                     ('float_block1', '<f4', n_floats),
+                     ('is_data', 'i1', n_range_levels),
+                     ('values', '<f4', n_values)])
+
+
+@lru_cache(maxsize=128)
+def _get_uncompressed_dtype(n_samples, n_keys):
+    """Returns dtype of uncompressed Level 0 spectra block of one profile.
+
+    Args:
+        n_samples (tuple): Number of spectral samples at each valid height.
+        n_keys (int): Number of spectral variables.
+
+    """
+    fields = []
+    for ind, n_samples_at_height in enumerate(n_samples):
+        fields += [(f"dummy{ind}", '<i4'),
+                   (f"values{ind}", '<f4', (n_keys * n_samples_at_height,))]
+    return np.dtype(fields)
+
+
+@lru_cache(maxsize=128)
+def _get_compressed_dtype(n_values, anti_alias):
+    """Returns dtype of compressed Level 0 spectra at one height (after the indices)."""
+    fields = [('values', '<f4', (n_values,)),
+              ('dummy', '<i4', (2,))]
+    if anti_alias == 1:
+        fields += [('is_anti_aliased', 'i1'),
+                   ('min_velocity', '<f4')]
+    return np.dtype(fields)
+
+
 def _get_n_samples(header):
     """Finds number of spectral samples at each height."""
-    array = np.ones(header['n_range_levels'], dtype=int)
-    sub_arrays = np.split(array, header['chirp_start_indices'][1:])
-    sub_arrays *= header['n_spectral_samples']
-    return np.concatenate(sub_arrays)
+    n_heights = np.diff([*header['chirp_start_indices'], header['n_range_levels']])
+    return np.repeat(header['n_spectral_samples'], n_heights)
 
 
-def _create_dict0(n_profiles):
-    return {'sample_length': np.zeros(n_profiles, np.int),
-            'time': np.zeros(n_profiles, np.int),
-            'time_ms': np.zeros(n_profiles, np.int),
-            'quality_flag': np.zeros(n_profiles, np.int)}
+def _create_dict0(profile_header):
+    return {name: profile_header[name].astype(int) for name in PROFILE_HEADER.names}
 
 
 def _create_dict1():
@@ -122,12 +122,9 @@ def _read_string(file_id):
     str_out = ''
     while True:
         value = np.fromfile(file_id, np.int8, 1)
-        if value:
-            if value < 0:
-                value = 0
-            str_out += chr(value)
-        else:
+        if not value.size or value[0] == 0:
             break
+        str_out += chr(max(value[0], 0))
     return str_out
 
 
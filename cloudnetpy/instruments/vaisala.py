@@ -1,12 +1,27 @@
 """Module with classes for Vaisala ceilometers."""
+import mmap
+import re
+from functools import lru_cache
 import numpy as np
 from cloudnetpy.instruments.ceilometer import Ceilometer
-from cloudnetpy import utils
 
 
 M2KM = 0.001
 SECONDS_IN_MINUTE = 60
 SECONDS_IN_HOUR = 3600
+TIMESTAMP_LINE = re.compile(rb'^-\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', re.MULTILINE)
+EMPTY_LINE = re.compile(rb'^\r?\n', re.MULTILINE)
+
+
+def _init_hex_table():
+    """Returns lookup table from ASCII codes to hex digit values (-1 = invalid)."""
+    table = np.full(256, -1, dtype=np.int8)
+    for chars, first_value in ((b'0123456789', 0), (b'abcdef', 10), (b'ABCDEF', 10)):
+        table[list(chars)] = np.arange(len(chars)) + first_value
+    return table
+
+
+HEX_TABLE = _init_hex_table()
 
 
 class VaisalaCeilo(Ceilometer):
@@ -18,10 +33,22 @@ class VaisalaCeilo(Ceilometer):
         self._message_number = None
 
     def _fetch_data_lines(self):
-        """Finds data lines (header + backscatter) from ceilometer file."""
-        with open(self.file_name) as file:
-            all_lines = file.readlines()
-        return self._screen_invalid_lines(all_lines)
+        """Finds data lines (header + backscatter) from ceilometer file.
+
+        Each message is assumed to have as many lines as the first one. The
+        last message is dropped if the file ends before its last line is
+        complete, e.g. when the file was copied while still being written.
+
+        """
+        with open(self.file_name, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            timestamps = [match.start() for match in TIMESTAMP_LINE.finditer(data)]
+            n_lines = _count_lines_until_empty_line(data, timestamps[0])
+            messages = [_read_lines(data, start, n_lines) for start in timestamps]
+        if not messages[-1][-1].endswith(b'\n'):
+            messages.pop()
+        return [[message[line_number] for message in messages]
+                for line_number in range(n_lines)]
 
     def _calc_range(self):
         """Calculates range vector from the resolution and number of gates."""
@@ -31,59 +58,32 @@ class VaisalaCeilo(Ceilometer):
         else:
             n_gates = int(self.metadata['number_of_gates'])
             range_resolution = int(self.metadata['range_resolution'])
-        return np.arange(n_gates)*range_resolution + range_resolution/2
+        return _calc_range_vector(n_gates, range_resolution)
 
-    def _read_backscatter(self, lines):
+    def _read_backscatter(self, hex_profiles):
         """Converts backscatter profile from 2-complement hex to floats."""
-        n_chars = self._hex_conversion_params[0]
-        n_gates = int(len(lines[0])/n_chars)
-        profiles = np.zeros((len(lines), n_gates), dtype=int)
-        ran = range(0, n_gates*n_chars, n_chars)
-        for ind, line in enumerate(lines):
-            try:
-                profiles[ind, :] = [int(line[i:i+n_chars], 16) for i in ran]
-            except ValueError:
-                print('Warning: bad value in raw ceilometer data')
-        ind = np.where(profiles & self._hex_conversion_params[1] != 0)
-        profiles[ind] -= self._hex_conversion_params[2]
+        n_chars, sign_bit, offset = self._hex_conversion_params
+        profiles = hex_to_int(hex_profiles, n_chars)
+        profiles -= (profiles & sign_bit) * (offset // sign_bit)
         return profiles.astype(float) / self._backscatter_scale_factor
 
-    @staticmethod
-    def _screen_invalid_lines(data):
-        """Removes empty (and other weird) lines from the list of data."""
-
-        def _find_timestamp_lines():
-            return [n for n, _ in enumerate(data) if utils.is_timestamp(data[n])]
-
-        def _find_number_of_data_lines(timestamp_line):
-            for i, line in enumerate(data[timestamp_line:]):
-                if utils.is_empty_line(line):
-                    return i
-
-        def _parse_data_lines(starting_indices):
-            return [[data[n + line_number] for n in starting_indices]
-                    for line_number in range(number_of_data_lines)]
-
-        timestamp_lines = _find_timestamp_lines()
-        number_of_data_lines = _find_number_of_data_lines(timestamp_lines[0])
-        return _parse_data_lines(timestamp_lines)
-
     @staticmethod
     def _get_message_number(header_line_1):
         msg_no = header_line_1['message_number']
-        assert len(np.unique(msg_no)) == 1, 'Error: inconsistent message numbers.'
+        assert np.all(msg_no == msg_no[0]), 'Error: inconsistent message numbers.'
         return int(msg_no[0])
 
     @staticmethod
     def _calc_time(time_lines):
         """Returns the time vector as fraction hour."""
-        time = [time_to_fraction_hour(line.split()[1]) for line in time_lines]
-        return np.array(time)
+        digits = lines_to_array(time_lines, 12, 8).astype(int) - ord('0')
+        hour, minute, sec = (digits[:, ind]*10 + digits[:, ind+1] for ind in (0, 3, 6))
+        return hour + (minute * SECONDS_IN_MINUTE + sec) / SECONDS_IN_HOUR
 
     @staticmethod
     def _calc_date(time_lines):
         """Returns the date [yyyy, mm, dd]"""
-        return time_lines[0].split()[0].strip('-').split('-')
+        return time_lines[0].decode().split()[0].strip('-').split('-')
 
     @classmethod
     def _handle_metadata(cls, header):
@@ -102,8 +102,9 @@ class VaisalaCeilo(Ceilometer):
     @staticmethod
     def _remove_meta_duplicates(meta):
         for field in meta:
-            if len(np.unique(meta[field])) == 1:
-                meta[field] = meta[field][0]
+            values = meta[field]
+            if len(values) > 0 and np.all(values == values[0]):
+                meta[field] = values[0]
         return meta
 
     @staticmethod
@@ -119,13 +120,10 @@ class VaisalaCeilo(Ceilometer):
                 except (ValueError, TypeError):
                     continue
             else:
-                meta[field] = [None] * len(values)
-                for ind, value in enumerate(values):
-                    try:
-                        meta[field][ind] = int(value)
-                    except (ValueError, TypeError):
-                        continue
-                meta[field] = np.array(meta[field])
+                try:
+                    meta[field] = values.astype(int)
+                except (ValueError, TypeError):
+                    meta[field] = _convert_strings_one_by_one(values)
         return meta
 
     def _read_common_header_part(self):
@@ -133,9 +131,9 @@ class VaisalaCeilo(Ceilometer):
         data_lines = self._fetch_data_lines()
         self.time = self._calc_time(data_lines[0])
         self.date = self._calc_date(data_lines[0])
-        header.append(self._read_header_line_1(data_lines[1]))
+        header.append(self._read_header_line_1(_decode(data_lines[1])))
         self._message_number = self._get_message_number(header[0])
-        header.append(self._read_header_line_2(data_lines[2]))
+        header.append(self._read_header_line_2(_decode(data_lines[2])))
         return header, data_lines
 
     def _read_header_line_1(self, lines):
@@ -146,8 +144,9 @@ class VaisalaCeilo(Ceilometer):
             indices = [1, 3, 4, 7, 8, 9]
         else:
             indices = [1, 3, 4, 6, 7, 8]
-        values = [split_string(line, indices) for line in lines]
-        return values_to_dict(fields, values)
+        slices = [slice(start, stop) for start, stop in zip(indices[:-1], indices[1:])]
+        return {key: np.array([line[part] for line in lines])
+                for key, part in zip(fields, slices)}
 
     @staticmethod
     def _read_header_line_2(lines):
@@ -159,8 +158,8 @@ class VaisalaCeilo(Ceilometer):
 
     def _range_correct_upper_part(self):
         altitude_limit = 2400
-        ind = np.where(self.range > altitude_limit)
-        self.backscatter[:, ind] *= (self.range[ind]*M2KM)**2
+        is_upper_part = self.range > altitude_limit
+        self.backscatter[:, is_upper_part] *= (self.range[is_upper_part]*M2KM)**2
 
 
 class ClCeilo(VaisalaCeilo):
@@ -175,10 +174,17 @@ class ClCeilo(VaisalaCeilo):
     def read_ceilometer_file(self):
         """Read all lines of data from the file."""
         header, data_lines = self._read_common_header_part()
-        header.append(self._read_header_line_4(data_lines[-3]))
+        header.append(self._read_header_line_4(_decode(data_lines[-3])))
         self.metadata = self._handle_metadata(header)
         self.range = self._calc_range()
-        self.backscatter = self._read_backscatter(data_lines[-2])
+        hex_profiles = self._parse_hex_profiles(data_lines[-2])
+        self.backscatter = self._read_backscatter(hex_profiles)
+
+    def _parse_hex_profiles(self, lines):
+        """Collects CL31/CL51 profiles into 2D array (one profile / row)."""
+        n_chars = self._hex_conversion_params[0]
+        n_gates = int(len(lines[0])/n_chars)
+        return lines_to_array(lines, 0, n_gates*n_chars)
 
     def _read_header_line_3(self, lines):
         if self._message_number != 2:
@@ -230,7 +236,7 @@ class Ct25k(VaisalaCeilo):
     def read_ceilometer_file(self):
         """Read all lines of data from the file."""
         header, data_lines = self._read_common_header_part()
-        header.append(self._read_header_line_3(data_lines[3]))
+        header.append(self._read_header_line_3(_decode(data_lines[3])))
         self.metadata = self._handle_metadata(header)
         self.range = self._calc_range()
         hex_profiles = self._parse_hex_profiles(data_lines[4:20])
@@ -241,10 +247,10 @@ class Ct25k(VaisalaCeilo):
 
     @staticmethod
     def _parse_hex_profiles(lines):
-        """Collects ct25k profiles into list (one profile / element)."""
-        n_profiles = len(lines[0])
-        return [''.join([lines[l][n][3:].strip() for l in range(16)])
-                for n in range(n_profiles)]
+        """Collects ct25k profiles into 2D array (one profile / row)."""
+        n_chars = len(lines[0][0][3:].strip())
+        return np.concatenate([lines_to_array(row, 3, n_chars) for row in lines],
+                              axis=1)
 
     def _read_header_line_3(self, lines):
         if self._message_number in (1, 3, 6):
@@ -257,21 +263,99 @@ class Ct25k(VaisalaCeilo):
         return values_to_dict(keys, values)
 
 
-def split_string(string, indices):
-    """Splits string between indices.
+@lru_cache(maxsize=8)
+def _calc_range_vector(n_gates, range_resolution):
+    """Returns read-only range vector (m), shared between files of same setup."""
+    range_vector = np.arange(n_gates)*range_resolution + range_resolution/2
+    range_vector.flags.writeable = False
+    return range_vector
+
+
+def _convert_strings_one_by_one(values):
+    """Converts strings to integers, using None for invalid values."""
+    converted = [None] * len(values)
+    for ind, value in enumerate(values):
+        try:
+            converted[ind] = int(value)
+        except (ValueError, TypeError):
+            continue
+    return np.array(converted)
 
-    Notes:
-        It is possible to skip characters from the beginning and end of the
-        string but not from the middle.
+
+def _count_lines_until_empty_line(data, start):
+    """Returns number of lines from start position to the next empty line."""
+    empty_line = EMPTY_LINE.search(data, start)
+    end = empty_line.start() if empty_line else len(data)
+    return data[start:end].count(b'\n')
+
+
+def _read_lines(data, start, n_lines):
+    """Returns n_lines consecutive lines (bytes, with line endings) from start position.
+
+    Lines missing from the end of the data are returned as empty bytes.
+
+    """
+    lines = []
+    for _ in range(n_lines):
+        end = (data.find(b'\n', start) + 1) or len(data)
+        lines.append(data[start:end])
+        start = end
+    return lines
+
+
+def _decode(lines):
+    """Decodes header lines into strings with Unix line endings."""
+    return [line.decode().replace('\r\n', '\n') for line in lines]
+
+
+def lines_to_array(lines, start, n_chars):
+    """Collects fixed-width parts of text lines into 2D array of ASCII codes.
+
+    Args:
+        lines (list): Text lines as bytes.
+        start (int): Index of the first character to be collected.
+        n_chars (int): Number of characters to be collected from each line.
+            Shorter lines are padded with spaces.
+
+    Returns:
+        ndarray: uint8 array of shape (len(lines), n_chars).
 
     Examples:
-        >>> s = 'abcde'
-        >>> indices = [1, 2, 4]
-        >>> split_string(s, indices)
-        ['b', 'cd']
+        >>> lines_to_array([b'#ab', b'#cd'], 1, 2)
+        array([[ 97,  98],
+               [ 99, 100]], dtype=uint8)
 
     """
-    return [string[n:m] for n, m in zip(indices[:-1], indices[1:])]
+    text = b''.join([line[start:start+n_chars].ljust(n_chars) for line in lines])
+    return np.frombuffer(text, dtype=np.uint8).reshape(len(lines), n_chars)
+
+
+def hex_to_int(hex_array, n_chars):
+    """Converts rows of fixed-width hex numbers into 2D integer array.
+
+    Args:
+        hex_array (ndarray): 2D array of ASCII codes of hex characters,
+            one row / profile.
+        n_chars (int): Number of hex characters in one value.
+
+    Returns:
+        ndarray: 2D array of shape (n_rows, n_columns / n_chars). Rows
+            containing invalid characters are set to zero.
+
+    Examples:
+        >>> hex_to_int(lines_to_array([b'000a00ff', b'01000020'], 0, 8), 4)
+        array([[ 10, 255],
+               [256,  32]], dtype=int32)
+
+    """
+    n_rows, n_columns = hex_array.shape
+    digits = HEX_TABLE[hex_array].reshape(n_rows, n_columns // n_chars, n_chars)
+    is_bad_row = np.any(digits < 0, axis=(1, 2))
+    if is_bad_row.any():
+        print('Warning: bad value in raw ceilometer data')
+        digits[is_bad_row] = 0
+    weights = 16 ** np.arange(n_chars - 1, -1, -1, dtype=np.int32)
+    return digits @ weights
 
 
 def values_to_dict(keys, values):
@@ -288,9 +372,3 @@ def values_to_dict(keys, values):
     for i, key in enumerate(keys):
         out[key] = np.array([x[i] for x in values])
     return out
-
-
-def time_to_fraction_hour(time):
-    """Returns time (hh:mm:ss) as fraction hour """
-    hour, minute, sec = time.split(':')
-    return int(hour) + (int(minute) * SECONDS_IN_MINUTE + int(sec)) / SECONDS_IN_HOUR
@@ -16,11 +16,9 @@ def update_attributes(cloudnet_variables, attributes):
         attributes (dict): Product-specific attributes.
 
     """
-    for key in cloudnet_variables:
-        if key in attributes:
-            cloudnet_variables[key].set_attributes(attributes[key])
-        if key in COMMON_ATTRIBUTES:
-            cloudnet_variables[key].set_attributes(COMMON_ATTRIBUTES[key])
+    for attribute_dict in (attributes, COMMON_ATTRIBUTES):
+        for key in cloudnet_variables.keys() & attribute_dict.keys():
+            cloudnet_variables[key].set_attributes(attribute_dict[key])
 
 
 def save_product_file(short_id, obj, file_name, copy_from_cat=()):
@@ -102,14 +100,11 @@ def _write_vars2nc(rootgrp, cloudnet_variables):
         """Finds correct dimensions for a variable."""
         if utils.isscalar(array):
             return ()
-        variable_size = ()
-        file_dims = rootgrp.dimensions
-        array_dims = array.shape
-        for length in array_dims:
-            dim = [key for key in file_dims.keys()
-                   if file_dims[key].size == length][0]
-            variable_size = variable_size + (dim,)
-        return variable_size
+        return tuple(dims_by_size[length] for length in array.shape)
+
+    dims_by_size = {}
+    for name, dimension in rootgrp.dimensions.items():
+        dims_by_size.setdefault(dimension.size, name)
 
     for key in cloudnet_variables:
         obj = cloudnet_variables[key]
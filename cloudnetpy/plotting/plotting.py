@@ -1,6 +1,8 @@
 """Misc. plotting routines for Cloudnet products."""
 
+import os
 from datetime import date
+from functools import lru_cache
 import numpy as np
 import numpy.ma as ma
 import netCDF4
@@ -187,10 +189,9 @@ def _read_ax_values(nc_file, ax_type=None):
 
     def _get_correct_dimension(field_names):
         """Model dimensions are different in old/new files."""
-        nc = netCDF4.Dataset(nc_file)
-        for name in field_names:
-            yield name.split('_')[-1] if name not in nc.variables else name
-        nc.close()
+        file_name = str(nc_file)
+        return list(_get_dimension_names(file_name, os.path.getmtime(file_name),
+                                         tuple(field_names)))
 
     if ax_type == 'model':
         fields = _get_correct_dimension(['model_time', 'model_height'])
@@ -201,6 +202,16 @@ def _read_ax_values(nc_file, ax_type=None):
     return time, height_km
 
 
+@lru_cache(maxsize=32)
+def _get_dimension_names(nc_file, mtime, field_names):
+    """Returns dimension names found in the file, cached per file version."""
+    nc = netCDF4.Dataset(nc_file)
+    variables = frozenset(nc.variables)
+    nc.close()
+    return tuple(name if name in variables else name.rsplit('_', 1)[-1]
+                 for name in field_names)
+
+
 def _screen_high_altitudes(data_field, ax_values, max_y):
     """Removes altitudes from 2D data that are not visible in the figure.
 
@@ -128,27 +128,17 @@ class DrizzleClassification(ProductClassification):
 
     def _find_drizzle(self):
         return (~utils.transpose(self.is_rain)
-                & self.category_bits['falling']
-                & ~self.category_bits['droplet']
-                & ~self.category_bits['cold']
-                & ~self.category_bits['melting']
-                & ~self.category_bits['insect']
-                & self.quality_bits['radar']
-                & self.quality_bits['lidar']
-                & ~self.quality_bits['clutter']
-                & ~self.quality_bits['molecular']
-                & ~self.quality_bits['attenuated']
+                & self.category_bits.match(('falling',),
+                                           ('droplet', 'cold', 'melting', 'insect'))
+                & self.quality_bits.match(('radar', 'lidar'),
+                                          ('clutter', 'molecular', 'attenuated'))
                 & self.is_v_sigma)
 
     def _find_would_be_drizzle(self):
         return (~utils.transpose(self.is_rain)
                 & self.warm_liquid
-                & self.category_bits['falling']
-                & ~self.category_bits['melting']
-                & ~self.category_bits['insect']
-                & self.quality_bits['radar']
-                & ~self.quality_bits['clutter']
-                & ~self.quality_bits['molecular'])
+                & self.category_bits.match(('falling',), ('melting', 'insect'))
+                & self.quality_bits.match(('radar',), ('clutter', 'molecular')))
 
     def _find_cold_rain(self):
         return np.any(self.category_bits['melting'], axis=1)
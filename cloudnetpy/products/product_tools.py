@@ -1,4 +1,6 @@
 """General helper classes and functions for all products."""
+from collections.abc import Mapping
+import numpy as np
 import netCDF4
 import cloudnetpy.utils as utils
 
@@ -10,11 +12,13 @@ class CategorizeBits:
         categorize_file (str): Categorize file name.
 
     Attributes:
-        category_bits (dict): Dictionary containing boolean fields for `droplet`,
-            `falling`, `cold`, `melting`, `aerosol`, `insect`.
+        category_bits (BitDict): Dictionary-like object containing boolean
+            fields for `droplet`, `falling`, `cold`, `melting`, `aerosol`,
+            `insect`.
 
-        quality_bits (dict): Dictionary containing boolean fields for `radar`,
-            `lidar`, `clutter`, `molecular`, `attenuated`, `corrected`.
+        quality_bits (BitDict): Dictionary-like object containing boolean
+            fields for `radar`, `lidar`, `clutter`, `molecular`, `attenuated`,
+            `corrected`.
 
     """
     category_keys = ('droplet', 'falling', 'cold', 'melting', 'aerosol',
@@ -25,17 +29,74 @@ class CategorizeBits:
 
     def __init__(self, categorize_file):
         self._categorize_file = categorize_file
-        self.category_bits = self._read_bits('category')
-        self.quality_bits = self._read_bits('quality')
+        nc = netCDF4.Dataset(categorize_file)
+        self.category_bits = self._read_bits(nc, 'category')
+        self.quality_bits = self._read_bits(nc, 'quality')
+        nc.close()
 
-    def _read_bits(self, bit_type):
-        """ Converts bitfield into dictionary."""
-        nc = netCDF4.Dataset(self._categorize_file)
+    @staticmethod
+    def _read_bits(nc, bit_type):
+        """ Converts bitfield into dictionary-like BitDict."""
         bitfield = nc.variables[f"{bit_type}_bits"][:]
         keys = getattr(CategorizeBits, f"{bit_type}_keys")
-        bits = {key: utils.isbit(bitfield, i) for i, key in enumerate(keys)}
-        nc.close()
-        return bits
+        return BitDict(bitfield, keys)
+
+
+class BitDict(Mapping):
+    """Read-only dictionary-like access to the bits of an integer bitfield.
+
+    The bitfield is stored as one byte per element. A bit is unpacked into
+    a boolean array when it is first accessed, and cached after that.
+
+    Args:
+        bitfield (ndarray): Integer array of bits.
+        keys (tuple): Names of the bits, starting from the lowest bit.
+
+    Examples:
+        >>> bits = BitDict(np.array([1, 2, 3]), ('droplet', 'falling'))
+        >>> bits['falling']
+        array([False,  True,  True])
+
+    """
+    def __init__(self, bitfield, keys):
+        dtype = np.uint8 if len(keys) <= 8 else bitfield.dtype
+        self._bitfield = bitfield.astype(dtype)
+        self._bit_index = {key: i for i, key in enumerate(keys)}
+        self._fields = {}
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            self._fields[key] = utils.isbit(self._bitfield, self._bit_index[key])
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self._bit_index)
+
+    def __len__(self):
+        return len(self._bit_index)
+
+    def match(self, set_bits=(), unset_bits=()):
+        """Finds elements where given bits are set and other given bits are not.
+
+        Args:
+            set_bits (tuple): Keys of the bits that must be set.
+            unset_bits (tuple): Keys of the bits that must not be set.
+
+        Returns:
+            ndarray: Boolean array, True where all conditions hold.
+
+        Examples:
+            >>> bits = BitDict(np.array([1, 2, 3]), ('droplet', 'falling'))
+            >>> bits.match(set_bits=('falling',), unset_bits=('droplet',))
+            array([False,  True, False])
+
+        """
+        set_mask = self._get_mask(set_bits)
+        unset_mask = self._get_mask(unset_bits)
+        return self._bitfield & (set_mask | unset_mask) == set_mask
+
+    def _get_mask(self, keys):
+        return sum(1 << self._bit_index[key] for key in keys)
 
 
 class ProductClassification(CategorizeBits):
@@ -53,9 +114,8 @@ class ProductClassification(CategorizeBits):
     """
     def __init__(self, categorize_file):
         super().__init__(categorize_file)
-        self.is_rain = read_nc_fields(categorize_file, 'is_rain')
-        self.is_undetected_melting = read_nc_fields(categorize_file,
-                                                    'is_undetected_melting')
+        self.is_rain, self.is_undetected_melting = read_nc_fields(
+            categorize_file, ['is_rain', 'is_undetected_melting'])
 
 
 def get_source(data_handler):
@@ -105,12 +165,10 @@ def interpolate_model(cat_file, names):
         List of arrays otherwise.
 
     """
-    def _interp_field(var_name):
-        values = read_nc_fields(cat_file, ['model_time', 'model_height',
-                                           var_name, 'time', 'height'])
-        return utils.interpolate_2d(*values)
-
     names = [names] if isinstance(names, str) else names
-    data = [_interp_field(name) for name in names]
+    model_time, model_height, time, height, *fields = read_nc_fields(
+        cat_file, ['model_time', 'model_height', 'time', 'height', *names])
+    data = [utils.interpolate_2d(model_time, model_height, field, time, height)
+            for field in fields]
     return data[0] if len(data) == 1 else data
 
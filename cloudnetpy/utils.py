@@ -2,6 +2,8 @@
 
 import uuid
 import datetime
+import mmap
+import os
 import numpy as np
 import numpy.ma as ma
 from scipy import stats, ndimage
@@ -626,20 +628,16 @@ def range_to_height(range_los, tilt_angle):
 
 def find_first_empty_line(file_name):
     """Finds first text file line that is empty."""
-    line_number = 1
-    with open(file_name) as file:
-        for line in file:
-            if is_empty_line(line):
-                break
-            line_number += 1
-    return line_number
-
-
-def is_empty_line(line):
-    """Tests if a line (of a text file) is empty."""
-    if line in ('\n', '\r\n'):
-        return True
-    return False
+    if os.path.getsize(file_name) == 0:
+        return 1
+    with open(file_name, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        empty_line = re.search(rb'^\r?\n', data, re.MULTILINE)
+        if empty_line:
+            return data[:empty_line.start()].count(b'\n') + 1
+        content = data[:]
+    n_lines = content.count(b'\n') + int(not content.endswith(b'\n'))
+    return n_lines + 1
 
 
 def is_timestamp(string):
@@ -1,6 +1,6 @@
-import subprocess
+import sys
 import pytest
-from tests import utils
+from tests import meta_qc, data_qc
 
 
 def check_metadata(file, log_file=None):
@@ -12,9 +12,7 @@ def check_metadata(file, log_file=None):
             messages are stored.
 
     """
-    test_path = utils.get_test_path()
-    script = f"{test_path}/meta_qc.py"
-    subprocess.call([script, file, _validate_log_file(log_file)])
+    _run_check(meta_qc, file, log_file)
 
 
 def check_data_quality(file, log_file=None):
@@ -26,9 +24,25 @@ def check_data_quality(file, log_file=None):
             messages are stored.
 
     """
-    test_path = utils.get_test_path()
-    script = f"{test_path}/data_qc.py"
-    subprocess.call([script, file, _validate_log_file(log_file)])
+    _run_check(data_qc, file, log_file)
+
+
+def _run_check(check, file, log_file):
+    """Runs a check script in this process, reporting its errors per file.
+
+    Unknown file types (ValueError) and unreadable files (OSError) are
+    reported and the next file can be checked. Other errors propagate.
+
+    Notes:
+        pytest does not officially support calling pytest.main() repeatedly
+        in one process. Test modules and conftest files are imported only
+        once, so edits to them need a new process to take effect.
+
+    """
+    try:
+        check.main(file, _validate_log_file(log_file))
+    except (ValueError, OSError) as error:
+        sys.stderr.write(f"\n{check.__name__} failed for {file}: {error}\n")
 
 
 def _validate_log_file(log_file):
@@ -4,15 +4,13 @@ from numpy.testing import assert_array_equal, assert_array_almost_equal
 from cloudnetpy.instruments import ceilometer
 
 
-def test_remove_noise():
-    noise = 2
+def test_find_low_snr():
+    noise = 0.4
     beta = ma.array([[1, 2, 3],
                      [1, 2, 3]], mask=False)
-    result = ma.array([[1, 2, 3],
-                       [1, 2, 3]],
-                      mask=[[1, 0, 0],
-                            [1, 0, 0]])
-    assert_array_equal(ceilometer._remove_noise(beta.mask, noise), result.mask)
+    result = [[1, 0, 0],
+              [1, 0, 0]]
+    assert_array_equal(ceilometer._find_low_snr(beta, noise), result)
 
 
 def test_calc_sigma_units():
@@ -76,21 +74,17 @@ def test_estimate_noise_from_top_gates():
                        result)
 
 
-def test_reset_low_values_above_saturation():
+def test_find_low_values_above_saturation():
     beta = ma.array([[0, 10, 1e-6, 3],
                      [0, 0, 0, 0.1],
                      [0, 0.6, 1.2, 1e-8]])
     noise = 1e-3
     saturated = [1, 0, 1]
-    result = ma.array([[0, 10, 1e-6, 3],
-                       [0, 0, 0, 0.1],
-                       [0, 0.6, 1.2, 1e-8]],
-                      mask=[[0, 0, 1, 0],
-                            [0, 0, 0, 0],
-                            [0, 0, 0, 1]])
-    call = ceilometer._reset_low_values_above_saturation(beta, saturated, noise)
-    assert_array_equal(call.data, result.data)
-    assert_array_equal(call.mask, result.mask)
+    result = [[0, 0, 1, 0],
+              [0, 0, 0, 0],
+              [0, 0, 0, 1]]
+    call = ceilometer._find_low_values_above_saturation(beta, saturated, noise)
+    assert_array_equal(call, result)
 
 
 def test_find_saturated_profiles():
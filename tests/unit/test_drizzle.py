@@ -4,6 +4,7 @@ from pathlib import Path
 import cloudnetpy.products.drizzle as drizzle
 from cloudnetpy.products.drizzle import *
 from cloudnetpy.products.drizzle_error import get_drizzle_error
+from cloudnetpy.products.product_tools import BitDict, CategorizeBits
 
 DIMENSIONS_X = ('time', 'model_time')
 TEST_ARRAY_X = np.arange(2)
@@ -119,16 +120,30 @@ def drizzle_cat_file(tmpdir_factory, file_metadata):
     return file_name
 
 
+@pytest.fixture(scope='session')
+def drizzle_cat_ds(drizzle_cat_file):
+    nc = netCDF4.Dataset(drizzle_cat_file)
+    yield nc
+    nc.close()
+
+
 def test_find_v_sigma(drizzle_cat_file):
     obj = DrizzleClassification(drizzle_cat_file)
     compare = np.array([[1, 0, 1], [1, 1, 1]], dtype=bool)
     testing.assert_array_almost_equal(obj._find_v_sigma(drizzle_cat_file), compare)
 
 
+def _create_bits(bit_type, **fields):
+    keys = getattr(CategorizeBits, f"{bit_type}_keys")
+    bitfield = sum(np.asarray(fields.get(key, 0)) << i for i, key in enumerate(keys))
+    return BitDict(bitfield, keys)
+
+
 def test_find_warm_liquid(drizzle_cat_file):
     obj = DrizzleClassification(drizzle_cat_file)
-    obj.category_bits['droplet'] = np.array([0, 0, 0, 1, 1, 1, 0], dtype=bool)
-    obj.category_bits['cold'] = np.array([1, 1, 0, 0, 1, 0, 1], dtype=bool)
+    obj.category_bits = _create_bits('category',
+                                     droplet=np.array([0, 0, 0, 1, 1, 1, 0], dtype=bool),
+                                     cold=np.array([1, 1, 0, 0, 1, 0, 1], dtype=bool))
     compare = np.array([0, 0, 0, 1, 0, 1, 0], dtype=bool)
     testing.assert_array_almost_equal(obj._find_warm_liquid(), compare)
 
@@ -145,16 +160,10 @@ def test_find_drizzle(drizzle_cat_file, is_rain, falling, droplet, cold, melting
                       insect, radar, lidar, clutter, molecular, attenuated, v_sigma):
     obj = DrizzleClassification(drizzle_cat_file)
     obj.is_rain = is_rain
-    obj.category_bits['falling'] = falling
-    obj.category_bits['droplet'] = droplet
-    obj.category_bits['cold'] = cold
-    obj.category_bits['melting'] = melting
-    obj.category_bits['insect'] = insect
-    obj.quality_bits['radar'] = radar
-    obj.quality_bits['lidar'] = lidar
-    obj.quality_bits['clutter'] = clutter
-    obj.quality_bits['molecular'] = molecular
-    obj.quality_bits['attenuated'] = attenuated
+    obj.category_bits = _create_bits('category', falling=falling, droplet=droplet, cold=cold,
+                                     melting=melting, insect=insect)
+    obj.quality_bits = _create_bits('quality', radar=radar, lidar=lidar, clutter=clutter,
+                                    molecular=molecular, attenuated=attenuated)
     obj.is_v_sigma = v_sigma
     compare = np.array([[1, 1, 0, 0],
                         [1, 1, 0, 0],
@@ -174,12 +183,8 @@ def test_find_would_be_drizzle(drizzle_cat_file, is_rain, warm, falling, melting
     obj = DrizzleClassification(drizzle_cat_file)
     obj.is_rain = is_rain
     obj.warm_liquid = warm
-    obj.category_bits['falling'] = falling
-    obj.category_bits['melting'] = melting
-    obj.category_bits['insect'] = insect
-    obj.quality_bits['radar'] = radar
-    obj.quality_bits['clutter'] = clutter
-    obj.quality_bits['molecular'] = molecular
+    obj.category_bits = _create_bits('category', falling=falling, melting=melting, insect=insect)
+    obj.quality_bits = _create_bits('quality', radar=radar, clutter=clutter, molecular=molecular)
     compare = np.array([[0, 1, 1, 0],
                         [0, 1, 1, 0],
                         [0, 1, 1, 0],
@@ -193,28 +198,28 @@ def test_find_cold_rain(drizzle_cat_file):
     testing.assert_array_almost_equal(obj._find_cold_rain(), compare)
 
 
-def test_calculate_spectral_width(drizzle_cat_file):
+def test_calculate_spectral_width(drizzle_cat_file, drizzle_cat_ds):
     obj = CorrectSpectralWidth(drizzle_cat_file)
-    width = netCDF4.Dataset(drizzle_cat_file).variables['width'][:]
-    v_sigma = netCDF4.Dataset(drizzle_cat_file).variables['v_sigma'][:]
+    width = drizzle_cat_ds.variables['width'][:]
+    v_sigma = drizzle_cat_ds.variables['v_sigma'][:]
     factor = obj._calc_v_sigma_factor()
     compare = width - factor * v_sigma
     testing.assert_almost_equal(obj._calculate_spectral_width(), compare)
 
 
-def test_calc_beam_divergence(drizzle_cat_file):
+def test_calc_beam_divergence(drizzle_cat_file, drizzle_cat_ds):
     obj = CorrectSpectralWidth(drizzle_cat_file)
-    height = netCDF4.Dataset(drizzle_cat_file).variables['height'][:]
+    height = drizzle_cat_ds.variables['height'][:]
     compare = height * np.deg2rad(0.5)
     testing.assert_almost_equal(obj._calc_beam_divergence(), compare)
 
 
-def test_calc_v_sigma_factor(drizzle_cat_file):
+def test_calc_v_sigma_factor(drizzle_cat_file, drizzle_cat_ds):
     from cloudnetpy.utils import l2norm
     obj = CorrectSpectralWidth(drizzle_cat_file)
-    height = netCDF4.Dataset(drizzle_cat_file).variables['height'][:]
-    uwind = netCDF4.Dataset(drizzle_cat_file).variables['uwind'][:]
-    vwind = netCDF4.Dataset(drizzle_cat_file).variables['vwind'][:]
+    height = drizzle_cat_ds.variables['height'][:]
+    uwind = drizzle_cat_ds.variables['uwind'][:]
+    vwind = drizzle_cat_ds.variables['vwind'][:]
     beam = height * np.deg2rad(0.5)
     wind = l2norm(uwind, vwind)
     a_wind = (wind + beam) ** (2 / 3)
@@ -223,11 +228,11 @@ def test_calc_v_sigma_factor(drizzle_cat_file):
     testing.assert_array_almost_equal(obj._calc_v_sigma_factor(), compare)
 
 
-def test_calc_horizontal_wind(drizzle_cat_file):
+def test_calc_horizontal_wind(drizzle_cat_file, drizzle_cat_ds):
     from cloudnetpy.utils import l2norm
     obj = CorrectSpectralWidth(drizzle_cat_file)
-    uwind = netCDF4.Dataset(drizzle_cat_file).variables['uwind'][:]
-    vwind = netCDF4.Dataset(drizzle_cat_file).variables['vwind'][:]
+    uwind = drizzle_cat_ds.variables['uwind'][:]
+    vwind = drizzle_cat_ds.variables['vwind'][:]
     compare = l2norm(uwind, vwind)
     testing.assert_array_almost_equal(obj._calc_horizontal_wind(), compare)
 
@@ -4,6 +4,7 @@ from numpy import testing
 import pytest
 import netCDF4
 from cloudnetpy.products.iwc import IwcSource, _IceClassification
+from cloudnetpy.products.product_tools import BitDict, CategorizeBits
 
 DIMENSIONS = ('time', 'height', 'model_time', 'model_height')
 TEST_ARRAY = np.arange(3)
@@ -112,16 +113,20 @@ def iwc_cat_file(tmpdir_factory, file_metadata):
     return file_name
 
 
+def _create_bits(bit_type, **fields):
+    keys = getattr(CategorizeBits, f"{bit_type}_keys")
+    bitfield = sum(np.asarray(fields.get(key, 0)) << i for i, key in enumerate(keys))
+    return BitDict(bitfield, keys)
+
+
 @pytest.mark.parametrize("falling, cold, melting, insect, result", [
     (np.array([1, 1, 1, 1, 1, 1, 1]), np.array([0, 1, 0, 1, 0, 1, 0]),
      np.array([1, 1, 1, 0, 0, 0, 0]), np.array([0, 0, 0, 0, 0, 0, 0]),
      np.array([0, 0, 0, 1, 0, 1, 0]))])
 def test_find_ice(falling, cold, melting,  insect, result, iwc_cat_file):
     obj = _IceClassification(iwc_cat_file)
-    obj.category_bits['falling'] = falling
-    obj.category_bits['cold'] = cold
-    obj.category_bits['melting'] = melting
-    obj.category_bits['insect'] = insect
+    obj.category_bits = _create_bits('category', falling=falling, cold=cold, melting=melting,
+                                     insect=insect)
     testing.assert_array_equal(obj._find_ice().data, result)
 
 
@@ -131,10 +136,8 @@ def test_find_ice(falling, cold, melting,  insect, result, iwc_cat_file):
      np.array([1, 1, 1, 0, 1, 0, 1]))])
 def test_find_would_be_ice(falling, cold, melting,  insect, result, iwc_cat_file):
     obj = _IceClassification(iwc_cat_file)
-    obj.category_bits['falling'] = falling
-    obj.category_bits['cold'] = cold
-    obj.category_bits['melting'] = melting
-    obj.category_bits['insect'] = insect
+    obj.category_bits = _create_bits('category', falling=falling, cold=cold, melting=melting,
+                                     insect=insect)
     testing.assert_array_equal(obj._find_would_be_ice().data, result)
 
 
@@ -143,8 +146,7 @@ def test_find_would_be_ice(falling, cold, melting,  insect, result, iwc_cat_file
      np.array([0, 0, 1, 1, 0, 1, 1]), np.array([0, 0, 0, 1, 0, 0, 0]))])
 def test_find_corrected_ice(is_ice, attenuated, corrected, result, iwc_cat_file):
     obj = _IceClassification(iwc_cat_file)
-    obj.quality_bits['attenuated'] = attenuated
-    obj.quality_bits['corrected'] = corrected
+    obj.quality_bits = _create_bits('quality', attenuated=attenuated, corrected=corrected)
     obj.is_ice = is_ice
     testing.assert_array_equal(obj._find_corrected_ice().data, result)
 
@@ -154,8 +156,7 @@ def test_find_corrected_ice(is_ice, attenuated, corrected, result, iwc_cat_file)
      np.array([0, 0, 1, 0, 0, 0, 1]), np.array([0, 0, 0, 1, 0, 1, 0]))])
 def test_find_uncorrected_ice(is_ice, attenuated, corrected, result, iwc_cat_file):
     obj = _IceClassification(iwc_cat_file)
-    obj.quality_bits['attenuated'] = attenuated
-    obj.quality_bits['corrected'] = corrected
+    obj.quality_bits = _create_bits('quality', attenuated=attenuated, corrected=corrected)
     obj.is_ice = is_ice
     testing.assert_array_equal(obj._find_uncorrected_ice().data, result)
 
@@ -175,8 +176,7 @@ def test_find_ice_above_rain(is_ice, is_rain, result, iwc_cat_file):
      np.array([[0, 0, 0], [0, 0, 0], [0, 0, 1]]))])
 def test_find_cold_above_rain(cold, is_rain, melting, result, iwc_cat_file):
     obj = _IceClassification(iwc_cat_file)
-    obj.category_bits['cold'] = cold
-    obj.category_bits['melting'] = melting
+    obj.category_bits = _create_bits('category', cold=cold, melting=melting)
     obj.is_rain = is_rain
     testing.assert_array_equal(obj._find_cold_above_rain().data, result)
 
@@ -10,6 +10,8 @@ from cloudnetpy.categorize import atmos
 DIMENSIONS = ('time', 'height', 'model_time', 'model_height')
 TEST_ARRAY = np.arange(3)
 CategorizeBits = namedtuple('CategorizeBits', ['category_bits', 'quality_bits'])
+BITS = np.array([[1, 0, 1],
+                 [0, 1, 1]], dtype=bool)
 
 
 @pytest.fixture(scope='session')
@@ -77,12 +79,8 @@ class LwcSourceObj:
     def __init__(self):
         self.dheight = 10
         self.categorize_bits = \
-            CategorizeBits(category_bits={'droplet': np.asarray([[1, 0, 1],
-                                                                 [0, 1, 1]], dtype=bool)},
-                           quality_bits={'radar': np.asarray([[1, 0, 1],
-                                                              [0, 1, 1]], dtype=bool),
-                                         'lidar': np.asarray([[1, 0, 1],
-                                                              [0, 1, 1]], dtype=bool)})
+            CategorizeBits(category_bits={'droplet': BITS},
+                           quality_bits={'radar': BITS, 'lidar': BITS})
         self.atmosphere = (np.array([[282, 281, 280],
                                      [280, 279, 278]]),
                            np.array([[101000, 100500, 100000],
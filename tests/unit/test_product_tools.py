@@ -36,3 +36,25 @@ def test_quality_bits(fake_categorize_file):
 
 def test_read_nc_fields(fake_categorize_file):
     assert_array_equal(product_tools.read_nc_fields(fake_categorize_file, 'time'), np.arange(7))
+
+
+def test_bit_dict():
+    bitfield = np.array([[0, 1, 2], [3, 4, 7]])
+    bits = product_tools.BitDict(bitfield, ('a', 'b', 'c'))
+    assert_array_equal(bits['a'], [[0, 1, 0], [1, 0, 1]])
+    assert_array_equal(bits['b'], [[0, 0, 1], [1, 0, 1]])
+    assert_array_equal(bits['c'], [[0, 0, 0], [0, 1, 1]])
+    assert list(bits) == ['a', 'b', 'c']
+
+
+def test_bit_dict_caches_fields():
+    bits = product_tools.BitDict(np.array([0, 1]), ('a', 'b'))
+    assert bits['a'] is bits['a']
+
+
+def test_bit_dict_match():
+    bitfield = np.array([[0, 1, 2], [3, 4, 7]])
+    bits = product_tools.BitDict(bitfield, ('a', 'b', 'c'))
+    assert_array_equal(bits.match(('a',), ('b',)), [[0, 1, 0], [0, 0, 0]])
+    assert_array_equal(bits.match(('a', 'b')), [[0, 0, 0], [1, 0, 1]])
+    assert_array_equal(bits.match(unset_bits=('a', 'c')), [[1, 0, 1], [0, 0, 0]])
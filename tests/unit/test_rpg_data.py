@@ -0,0 +1,189 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from cloudnetpy.instruments import rpg_data
+
+N_PROFILES = 3
+N_RANGE = 6
+N_TEMPERATURE = 2
+N_HUMIDITY = 2
+CHIRP_START_INDICES = (0, 2)
+IS_DATA = np.array([[1, 0, 1, 1, 0, 1],
+                    [0, 1, 1, 0, 0, 1],
+                    [1, 1, 0, 1, 0, 0]], dtype=bool)
+MIN_INDICES = (0, 2)
+MAX_INDICES = (0, 3)
+
+
+class RpgFileWriter:
+    """Writes a minimal version 3 RPG binary file with known contents."""
+
+    def __init__(self, level, dual_polarization=0, compression=0, anti_alias=0,
+                 n_spectral_samples=(8, 4), uniform=False):
+        self.level = level
+        self.dual_polarization = dual_polarization
+        self.compression = compression
+        self.anti_alias = anti_alias
+        self.n_spectral_samples = n_spectral_samples
+        self.uniform = uniform
+        self.n_keys = self._get_n_keys()
+        self.n_floats = self._get_n_floats()
+        self.chunks = []
+        self.values = []
+
+    def write(self, file_name):
+        self._write_header()
+        self._write_data()
+        with open(file_name, 'wb') as file:
+            file.write(b''.join(self.chunks))
+
+    def _get_n_keys(self):
+        if self.level == 1:
+            return 5 + 3*(self.dual_polarization > 0) + 5*(self.dual_polarization == 2)
+        return (1 + 3*(self.dual_polarization > 0) + 3*(self.compression == 2)
+                + 2*(self.compression == 2 and self.dual_polarization == 2))
+
+    def _get_n_floats(self):
+        n_floats = 17 + 3 + N_TEMPERATURE + 2*N_HUMIDITY + 2*N_RANGE
+        if self.level == 0 and self.dual_polarization > 0:
+            n_floats += 2*N_RANGE
+        return n_floats
+
+    def _add(self, dtype, values):
+        self.chunks.append(np.asarray(values, dtype=dtype).tobytes())
+
+    def _write_header(self):
+        level0 = self.level == 0
+        n_chirps = len(CHIRP_START_INDICES)
+        self._add('<i4', [889346 if level0 else 889347, 0])
+        self._add('<u4', [0, 100])
+        self._add('<i4', [1, 2])
+        self.chunks.append(b'RPG-FMCW\x00\x00')
+        self._add('<f4', [94, 1, 0.5, 1000, 0.5] + [1.5]*level0)
+        self._add('i1', [self.dual_polarization] + [self.compression, self.anti_alias]*level0)
+        self._add('<f4', [1, 60, 24])
+        self._add('<i4', [0, N_RANGE, N_TEMPERATURE, N_HUMIDITY, n_chirps])
+        self._add('<f4', np.arange(N_RANGE)*30 + 100)
+        self._add('<f4', np.arange(N_TEMPERATURE + N_HUMIDITY))
+        if level0:
+            self._add('<f4', np.ones(N_RANGE))
+        self._add('<i4', [*self.n_spectral_samples, *CHIRP_START_INDICES, 1, 1])
+        self._add('<f4', [1, 1, 30, 30, 10, 5])
+        if level0:
+            self._add('<f4', [1]*n_chirps)
+            self._add('<i4', [1]*6*n_chirps)
+            self._add('<f4', [1]*2*n_chirps)
+            self._add('<i4', [1]*3*n_chirps + [1, 1])
+        self._add('i1', [0]*5)
+        self._add('<i4', [1])
+        self._add('<f4', [1])
+        if level0:
+            self._add('<i4', [0]*25)
+            self._add('<u4', [0]*10000)
+
+    def _write_data(self):
+        self._add('<i4', [N_PROFILES])
+        for prof in range(N_PROFILES):
+            self._add('<i4', [1234])
+            self._add('<u4', [prof*10])
+            self._add('<i4', [prof])
+            self._add('i1', [prof])
+            self._add('<f4', np.arange(self.n_floats) + prof + 0.25)
+            is_data = IS_DATA[0] if self.uniform else IS_DATA[prof]
+            self._add('i1', is_data)
+            if self.level == 1:
+                self._write_values(np.count_nonzero(is_data)*self.n_keys)
+            else:
+                for alt_ind in np.where(is_data)[0]:
+                    self._write_spectra(alt_ind)
+
+    def _write_values(self, n_values):
+        values = len(self.values)*100 + np.arange(n_values)
+        self.values.append(values)
+        self._add('<f4', values)
+
+    def _write_spectra(self, alt_ind):
+        if self.compression == 0:
+            self._add('<i4', [0])
+            self._write_values(self.n_keys*self._get_n_samples()[alt_ind])
+        else:
+            self._add('<i4', [0])
+            self._add('i1', [len(MIN_INDICES)])
+            self._add('<i2', MIN_INDICES)
+            self._add('<i2', MAX_INDICES)
+            self._write_values(self.n_keys*len(_get_compressed_indices()))
+            self._add('<i4', [0, 0])
+            if self.anti_alias == 1:
+                self._add('i1', [1])
+                self._add('<f4', [2.5])
+
+    def _get_n_samples(self):
+        lengths = np.diff([*CHIRP_START_INDICES, N_RANGE])
+        return np.repeat(self.n_spectral_samples, lengths)
+
+    def expected(self, keys):
+        """Returns expected Doppler moments or spectra from the written values."""
+        values = iter(self.values)
+        max_spectra = max(self.n_spectral_samples)
+        shape = (N_PROFILES, N_RANGE) if self.level == 1 else (N_PROFILES, N_RANGE,
+                                                               max_spectra)
+        data = {key: np.zeros(shape) for key in keys}
+        for prof in range(N_PROFILES):
+            is_data = IS_DATA[0] if self.uniform else IS_DATA[prof]
+            if self.level == 1:
+                block = next(values).reshape(-1, self.n_keys)
+                for n, key in enumerate(keys):
+                    data[key][prof, is_data] = block[:, n]
+                continue
+            for alt_ind in np.where(is_data)[0]:
+                blocks = np.split(next(values), self.n_keys)
+                if self.compression == 0:
+                    indices = np.arange(len(blocks[0]))
+                else:
+                    indices = _get_compressed_indices()
+                for key, block in zip(keys, blocks):
+                    data[key][prof, alt_ind, indices] = block
+        return data
+
+
+def _get_compressed_indices():
+    return np.concatenate([np.arange(i1, i2 + 1)
+                           for i1, i2 in zip(MIN_INDICES, MAX_INDICES)])
+
+
+@pytest.mark.parametrize("level, dual_polarization, compression, anti_alias, "
+                         "n_spectral_samples, uniform", [
+                             (1, 0, 0, 0, (8, 4), False),
+                             (1, 0, 0, 0, (8, 4), True),
+                             (1, 1, 0, 0, (8, 4), True),
+                             (1, 2, 0, 0, (8, 4), False),
+                             (1, 2, 0, 0, (8, 4), True),
+                             (0, 0, 0, 0, (8, 4), False),
+                             (0, 1, 0, 0, (8, 4), False),
+                             (0, 0, 1, 0, (8, 4), False),
+                             (0, 0, 1, 1, (8, 4), False),
+                             (0, 2, 2, 1, (8, 8), False)])
+def test_rpg_bin(tmpdir, level, dual_polarization, compression, anti_alias,
+                 n_spectral_samples, uniform):
+    file_name = str(tmpdir.join('file.rpg'))
+    writer = RpgFileWriter(level, dual_polarization, compression, anti_alias,
+                           n_spectral_samples, uniform)
+    writer.write(file_name)
+    obj = rpg_data.RpgBin(file_name)
+    assert obj.header['program_name'] == 'RPG-FMCW'
+    assert_array_equal(obj.data['time'], [0, 10, 20])
+    assert_array_equal(obj.data['time_ms'], [0, 1, 2])
+    assert_array_equal(obj.data['quality_flag'], [0, 1, 2])
+    assert_array_equal(obj.data['rain_rate'], [0.25, 1.25, 2.25])
+    assert_array_equal(obj.data['pc_temperature'], [16.25, 17.25, 18.25])
+    keys = list(rpg_data._create_dict2(level, obj.header))
+    assert len(keys) == writer.n_keys
+    for key, expected in writer.expected(keys).items():
+        assert_array_equal(obj.data[key], expected)
+
+
+def test_get_n_samples():
+    header = {'n_range_levels': 6,
+              'chirp_start_indices': np.array([0, 3]),
+              'n_spectral_samples': np.array([8, 4])}
+    assert_array_equal(rpg_data._get_n_samples(header), [8, 8, 8, 4, 4, 4])
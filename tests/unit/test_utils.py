@@ -380,16 +380,6 @@ def test_date_range():
         assert str(d) == res
 
 
-@pytest.mark.parametrize("input, result", [
-    ('A line', False),
-    ('', False),
-    ('\n', True),
-    ('\r\n', True),
-])
-def test_is_empty_line(input, result):
-    assert utils.is_empty_line(input) == result
-
-
 def test_find_first_empty_line(tmpdir):
     file_name = '/'.join((str(tmpdir), 'file.txt'))
     f = open(file_name, 'w')
@@ -2,16 +2,7 @@
 from cloudnetpy.instruments import vaisala
 import pytest
 import numpy as np
-from numpy.testing import assert_equal
-
-
-@pytest.mark.parametrize("input, result", [
-    ('01:30:00', 1.5),
-    ('02:00:00', 2),
-    ('13:15:00', 13.25),
-])
-def test_time_to_fraction_hour(input, result):
-    assert vaisala.time_to_fraction_hour(input) == result
+from numpy.testing import assert_equal, assert_array_almost_equal
 
 
 @pytest.mark.parametrize("keys, values, result", [
@@ -22,10 +13,77 @@ def test_values_to_dict(keys, values, result):
     assert_equal(vaisala.values_to_dict(keys, values), result)
 
 
-@pytest.mark.parametrize("string, indices, result", [
-    ('abcd', [3, 4], ['d']),
-    ('abcd', [0, 4], ['abcd']),
-    ('abcdedfg', [1, 2, 4, 5], ['b', 'cd', 'e']),
+@pytest.mark.parametrize("lines, start, n_chars, result", [
+    ([b'abcd', b'efgh'], 1, 2, [[98, 99], [102, 103]]),
+    ([b'abcd\n', b'ef'], 0, 4, [[97, 98, 99, 100], [101, 102, 32, 32]]),
+])
+def test_lines_to_array(lines, start, n_chars, result):
+    assert_equal(vaisala.lines_to_array(lines, start, n_chars), result)
+
+
+@pytest.mark.parametrize("lines, n_chars, result", [
+    ([b'000a00ff', b'01000020'], 4, [[10, 255], [256, 32]]),
+    ([b'0AFff', b'12345'], 5, [[45055], [74565]]),
+    ([b'000a00ff', b'0x000020'], 4, [[10, 255], [0, 0]]),
+])
+def test_hex_to_int(lines, n_chars, result):
+    hex_array = vaisala.lines_to_array(lines, 0, len(lines[0]))
+    assert_equal(vaisala.hex_to_int(hex_array, n_chars), result)
+
+
+def test_calc_time():
+    time_lines = [b'-2019-05-17 01:30:00\n', b'-2019-05-17 13:15:36\n']
+    assert_array_almost_equal(vaisala.VaisalaCeilo._calc_time(time_lines),
+                              [1.5, 13.26])
+
+
+MESSAGE = (b'-2019-05-17 01:30:00', b'CL020111', b'00100 01234', b'0000a0000b')
+
+
+def _create_file(file_name, messages, line_ending):
+    lines = [line for message in messages for line in (*message, b'')]
+    with open(file_name, 'wb') as file:
+        file.write(b''.join(line + line_ending for line in lines))
+
+
+@pytest.mark.parametrize("line_ending", [b'\n', b'\r\n'])
+def test_fetch_data_lines(tmpdir, line_ending):
+    file_name = str(tmpdir.join('ceilo.txt'))
+    second_message = (b'-2019-05-17 01:30:15', *MESSAGE[1:])
+    _create_file(file_name, (MESSAGE, second_message), line_ending)
+    data_lines = vaisala.VaisalaCeilo(file_name)._fetch_data_lines()
+    assert len(data_lines) == len(MESSAGE)
+    for first, second, lines in zip(MESSAGE, second_message, data_lines):
+        assert lines == [first + line_ending, second + line_ending]
+
+
+@pytest.mark.parametrize("line_ending", [b'\n', b'\r\n'])
+def test_fetch_data_lines_with_truncated_message(tmpdir, line_ending):
+    file_name = str(tmpdir.join('ceilo.txt'))
+    _create_file(file_name, (MESSAGE, MESSAGE), line_ending)
+    with open(file_name, 'ab') as file:
+        file.write(line_ending.join(MESSAGE[:2]) + line_ending + MESSAGE[2][:3])
+    data_lines = vaisala.VaisalaCeilo(file_name)._fetch_data_lines()
+    assert [len(lines) for lines in data_lines] == [2] * len(MESSAGE)
+
+
+@pytest.mark.parametrize("data, result", [
+    (b'-2019\nab\ncd\n\n-2019\n', 3),
+    (b'-2019\r\nab\r\ncd\r\n\r\n-2019\r\n', 3),
+    (b'-2019\nab\ncd\n', 3),
+])
+def test_count_lines_until_empty_line(data, result):
+    assert vaisala._count_lines_until_empty_line(data, 0) == result
+
+
+@pytest.mark.parametrize("data, start, n_lines, result", [
+    (b'ab\ncd\nef\n', 3, 2, [b'cd\n', b'ef\n']),
+    (b'ab\r\ncd\r\n', 0, 2, [b'ab\r\n', b'cd\r\n']),
+    (b'ab\ncd', 0, 3, [b'ab\n', b'cd', b'']),
 ])
-def test_split_string(string, indices, result):
-    assert_equal(vaisala.split_string(string, indices), result)
+def test_read_lines(data, start, n_lines, result):
+    assert vaisala._read_lines(data, start, n_lines) == result
+
+
+def test_decode():
+    assert vaisala._decode([b'ab\r\n', b'cd\n']) == ['ab\n', 'cd\n']
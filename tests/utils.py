@@ -23,12 +23,18 @@ def fill_log(test_function, problem_variables):
 
 
 def init_logger(test_file_name, log_file_name):
+    """Directs logging to the given file, replacing the file of previous calls."""
+    logger = logging.getLogger()
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.FileHandler):
+            logger.removeHandler(handler)
+            handler.close()
     if not log_file_name:
         return
-    logging.basicConfig(filename=f'{log_file_name}',
-                        format='%(asctime)s - %(name)s - %(message)s',
-                        level=logging.DEBUG,
-                        filemode='a')
+    handler = logging.FileHandler(log_file_name, mode='a')
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
     file_type = get_file_type(test_file_name)
     #site, date = get_site_info(test_file_name)
     logging.root.name = f"{test_file_name} - {file_type}"